@@ -4,14 +4,22 @@
 
 https://github.com/ThomasRieutord/metplotlib
 """
-import os
+import importlib.metadata
 
-package_rootdir = os.path.dirname(os.path.realpath(__path__[0]))
+try:
+    __version__ = importlib.metadata.version("metplotlib")
+except importlib.metadata.PackageNotFoundError:
+    # Source checkout that is not installed
+    __version__ = "unknown"
 
-with open(os.path.join(package_rootdir, "pyproject.toml"), "r") as f:
-    for l in f.readlines():
-        if "version =" in l:
-            __version__ = l.split('"')[1]
-            break
+del importlib
 
-del f, l, os
+
+def __getattr__(name):
+    """Compute `package_rootdir` only when it is requested"""
+    if name == "package_rootdir":
+        import os
+
+        return os.path.dirname(__path__[0])
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,14 +7,12 @@ Colormap loading
 Color levels -> ListedColormap (discrete set of values), used in `matplotlib.pyplot.contourf`
 Color maps -> Colormap (continuous set of values), used in `matplotlib.pyplot.pcolormesh`
 """
+import functools
 import json
 import os
 
-import numpy as np
 from matplotlib import colors
 
-from metplotlib import package_rootdir
-
 
 def _load_colormap_from_json(jsonfile):
     """Load the colormap written in a JSON file
@@ -45,17 +43,48 @@ def _load_colormap_from_json(jsonfile):
 
 # Color levels -> ListedColormap (discrete set of values), used in `matplotlib.pyplot.contourf`
 # ------------
-temperature_colorlevels = _load_colormap_from_json(
-    os.path.join(
-        package_rootdir, "metplotlib", "colormaps", "temperature_colorlevels.json"
+# The JSON files are only read (and the colormap built) once per family, on first request
+colorlevels_families = ("temperature", "radar", "wind")
+
+
+@functools.lru_cache(maxsize=None)
+def _load_colorlevels(family):
+    """Return the color levels of the given family, built once then kept in memory"""
+    return _load_colormap_from_json(
+        os.path.join(os.path.dirname(__file__), f"{family}_colorlevels.json")
     )
-)
-radar_colorlevels = _load_colormap_from_json(
-    os.path.join(package_rootdir, "metplotlib", "colormaps", "radar_colorlevels.json")
-)
-wind_colorlevels = _load_colormap_from_json(
-    os.path.join(package_rootdir, "metplotlib", "colormaps", "wind_colorlevels.json")
-)
+
+
+def __getattr__(name):
+    """Load `temperature_colorlevels`, `radar_colorlevels`, `wind_colorlevels` on first access"""
+    family = name[: -len("_colorlevels")]
+    if name.endswith("_colorlevels") and family in colorlevels_families:
+        return _load_colorlevels(family)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Variable family aliases, shared by color levels and color maps
+varfamily_aliases = {
+    "T": "temperature",
+    "temp": "temperature",
+    "temperature": "temperature",
+    "FF": "wind",
+    "wind": "wind",
+    "wind_speed": "wind",
+    "RR": "radar",
+    "radar": "radar",
+    "precipitation": "radar",
+}
+
+
+def _get_family(varfamily):
+    """Return the family name for the given variable family alias (None if unknown)"""
+    family = varfamily_aliases.get(varfamily)
+    if family is None and varfamily.startswith("air_temperature"):
+        family = "temperature"
+
+    return family
 
 
 def get_colorlevels_from_varfamily(varfamily):
@@ -73,16 +102,11 @@ def get_colorlevels_from_varfamily(varfamily):
     colorlevels: tuple of (`ListedColormap`, `BoundaryNorm`)
         Discrete values colormap and boundaries for the color to be applied
     """
-    if varfamily in ["T", "temp", "temperature"] or varfamily[:15] == "air_temperature":
-        colorlevels = temperature_colorlevels
-    elif varfamily in ["FF", "wind", "wind_speed"]:
-        colorlevels = wind_colorlevels
-    elif varfamily in ["RR", "radar", "precipitation"]:
-        colorlevels = radar_colorlevels
-    else:
+    family = _get_family(varfamily)
+    if family not in colorlevels_families:
         raise ValueError(f"Unable to find color levels for varfamily={varfamily}")
 
-    return colorlevels
+    return _load_colorlevels(family)
 
 
 # Color maps -> Colormap (continuous set of values), used in `matplotlib.pyplot.pcolormesh`
@@ -90,6 +114,11 @@ def get_colorlevels_from_varfamily(varfamily):
 temperature_colormap = "rainbow"
 wind_colormap = "spring"
 diff_colormap = "bwr"
+colormaps_by_family = {
+    "temperature": temperature_colormap,
+    "wind": wind_colormap,
+    "diff": diff_colormap,
+}
 
 
 def get_colormap_from_varfamily(varfamily):
@@ -107,19 +136,13 @@ def get_colormap_from_varfamily(varfamily):
     colorshade: str
         Name of the matplotlib colormap for this family of variable
     """
-    if varfamily in ["T", "temp", "temperature"] or varfamily[:15] == "air_temperature":
-        colorshade = temperature_colormap
-    elif varfamily in ["FF", "wind", "wind_speed"]:
-        colorshade = wind_colormap
-    elif varfamily.lower() == "diff":
-        colorshade = diff_colormap
-    else:
+    family = _get_family(varfamily)
+    if family is None and varfamily.lower() == "diff":
+        family = "diff"
+
+    if family not in colormaps_by_family:
         raise ValueError(
             f"Unable to find continuous colormap for varfamily={varfamily}"
         )
 
-    return colorshade
-
-
-# Remove unnecessary attributes
-del json, np, colors, os, package_rootdir
+    return colormaps_by_family[family]
@@ -9,22 +9,140 @@ Notes
 -----
 For more info on figure/data CRS, see [here](https://scitools.org.uk/cartopy/docs/latest/tutorials/understanding_transform.html)
 """
-import cartopy.crs as ccrs
-import cartopy.feature as cfeature
+import functools
+
 import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib import colormaps as mplcm
+from matplotlib.cm import ScalarMappable
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.lines import Line2D
 
 from metplotlib import colormaps as metcm
 
+# Cartopy is imported only where it is needed, so that non-map plots (`plumes`,
+# `quantiles`) do not pay for the import of cartopy and pyproj
+
 default_figsize = (12, 12)
 str4x4 = np.array([["", ""], ["", ""]])
 
 
+class _MaxSpanScaler:
+    """Natural Earth scale chosen from the largest span of the map extent
+
+    "110m" above 100 degrees, "50m" between 10 and 100 degrees, "10m" below 10
+    degrees. It has the interface of `cartopy.feature.Scaler`, so it can be given
+    as scale to a Natural Earth feature.
+    """
+
+    def __init__(self):
+        self._scale = "110m"
+
+    @property
+    def scale(self):
+        return self._scale
+
+    def scale_from_extent(self, extent):
+        """Update the scale from an extent (x0, x1, y0, y1) in degrees and return it"""
+        if extent is not None:
+            span = max(extent[1] - extent[0], extent[3] - extent[2])
+            if span > 100:
+                self._scale = "110m"
+            elif span >= 10:
+                self._scale = "50m"
+            else:
+                self._scale = "10m"
+
+        return self._scale
+
+
+@functools.lru_cache(maxsize=None)
+def _get_land_feature(resolution="auto"):
+    """Land feature, shared across calls so that cartopy's caches are reused
+
+    With resolution="auto", the Natural Earth scale is chosen at draw time from
+    the extent of the map (see `_MaxSpanScaler`).
+
+    Cartopy keeps the geometries read from the shapefile and, for each target
+    projection, the paths projected from these geometries. Sharing the feature
+    keeps the geometries identical from one call to another, so the projection
+    of the land polygons is only done once per figure CRS.
+    """
+    import cartopy.feature as cfeature
+
+    if resolution == "auto":
+        resolution = _MaxSpanScaler()
+
+    return cfeature.NaturalEarthFeature(
+        "physical",
+        "land",
+        resolution,
+        edgecolor="face",
+        facecolor=cfeature.COLORS["land"],
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_coastline_feature(resolution="auto"):
+    """Coastline feature, shared across calls and axes (see `_get_land_feature`)"""
+    import cartopy.feature as cfeature
+
+    if resolution == "auto":
+        resolution = _MaxSpanScaler()
+
+    return cfeature.COASTLINE.with_scale(resolution)
+
+
+@functools.lru_cache(maxsize=32)
+def _get_colorlevels(varfamily):
+    """Colormap, norm and level values of a variable family, computed once per family"""
+    colormap, norm = metcm.get_colorlevels_from_varfamily(varfamily)
+    return colormap, norm, norm.boundaries[1:-1]
+
+
+def _add_coastlines(ax, resolution="auto"):
+    """Same as `ax.coastlines` but with the shared coastline feature"""
+    ax.add_feature(
+        _get_coastline_feature(resolution),
+        edgecolor="black",
+        facecolor="none",
+        linewidth=0.5,
+    )
+
+
+def _add_colorbar(mappable, clabel, ax=None, **kwargs):
+    """Add a vertical colorbar with the style shared by all plots"""
+    cbar = plt.colorbar(
+        mappable,
+        ax=ax,
+        extend="both",
+        orientation="vertical",
+        shrink=0.3,
+        **kwargs,
+    )
+    cbar.ax.tick_params(labelsize=10)
+    cbar.set_label(clabel, fontsize=10)
+
+    return cbar
+
+
+def _replace_default_crs(figcrs, datcrs):
+    """Replace None by default values for figure and data CRS"""
+    import cartopy.crs as ccrs
+
+    if figcrs is None:
+        figcrs = ccrs.PlateCarree()
+
+    if datcrs is None:
+        datcrs = ccrs.PlateCarree()
+
+    return figcrs, datcrs
+
+
 def _replace_default_figax(fig, ax, figcrs=None):
     """Replace None by default values for Figure and Axes"""
     if fig is None:
-        fig = plt.figure(figsize=default_figsize)
+        fig = plt.figure(figsize=default_figsize) if ax is None else ax.figure
 
     if ax is None:
         ax = plt.subplot(projection=figcrs)
@@ -35,19 +153,147 @@ def _replace_default_figax(fig, ax, figcrs=None):
 def _replace_default_latlon(lons, lats, data):
     """Replace None by default values for longitudes and latitudes"""
     if lons is None:
-        lons = np.arange(data.shape[1])
+        lons = np.arange(data.shape[1], dtype=np.float64)
     if lats is None:
-        lats = np.arange(data.shape[0])
+        lats = np.arange(data.shape[0], dtype=np.float64)
 
     assert (
         lons.ndim == lats.ndim
     ), "Longitudes and latitudes do not have the same number of dimensions"
     if lons.ndim == 1:
-        lons, lats = np.meshgrid(lons, lats)
+        # Broadcast views, no (n_lats, n_lons) copy is made
+        lons, lats = np.meshgrid(lons, lats, copy=False)
 
     return lons, lats
 
 
+def _project_grid(lons, lats, figcrs, datcrs):
+    """Transform the grid points from the data CRS to the figure CRS
+
+    Also returns the mask of the points that cannot be plotted in the figure CRS
+    (None if there is none): points outside of its domain, which do not project
+    to finite values, and points on both sides of a jump in the projected
+    x-coordinates, which occur when the grid crosses the dateline of the figure
+    CRS. Non-finite coordinates are replaced by finite values because matplotlib
+    rejects them.
+    """
+    if figcrs == datcrs:
+        return lons, lats, None
+
+    xyz = figcrs.transform_points(datcrs, lons, lats)
+    px, py = xyz[..., 0], xyz[..., 1]
+
+    finite = np.isfinite(px) & np.isfinite(py)
+    invalid = ~finite
+    threshold = (figcrs.x_limits[1] - figcrs.x_limits[0]) / 2
+    with np.errstate(invalid="ignore"):
+        jump = np.abs(np.diff(px, axis=1)) > threshold
+    invalid[:, 1:] |= jump
+    invalid[:, :-1] |= jump
+    if not invalid.any():
+        return px, py, None
+
+    if finite.any():
+        px = np.where(finite, px, px[finite].mean())
+        py = np.where(finite, py, py[finite].mean())
+    else:
+        px = np.zeros_like(px)
+        py = np.zeros_like(py)
+
+    return px, py, invalid
+
+
+def _mask_invalid(data, invalid):
+    """Mask the data on the points that cannot be plotted (see `_project_grid`)"""
+    if invalid is None:
+        return data
+
+    return np.ma.masked_where(invalid, data)
+
+
+def _is_angular(crs):
+    """True if the coordinates of the CRS are longitudes and latitudes in degrees"""
+    import cartopy.crs as ccrs
+
+    return isinstance(crs, (ccrs.Geodetic, ccrs.PlateCarree, ccrs.RotatedPole))
+
+
+def _interp_edges(x, axis):
+    """Edges between consecutive values of x along the axis, extrapolated at the ends"""
+    x = np.moveaxis(x, axis, 0)
+    mid = (x[1:] + x[:-1]) / 2
+    edges = np.concatenate([2 * x[:1] - mid[:1], mid, 2 * x[-1:] - mid[-1:]])
+    return np.moveaxis(edges, 0, axis)
+
+
+def _project_cells(lons, lats, figcrs, datcrs):
+    """Corners of the grid cells, transformed from the data CRS to the figure CRS
+
+    The corners are the same as the cell edges `pcolormesh` computes with
+    shading="nearest", but they are computed in the data CRS, where the grid is
+    regular, rather than in the figure CRS: there, they would be interpolated
+    across the points that cannot be plotted. The arrays returned have one more
+    row and column than the grid, so `pcolormesh` uses them with shading="flat".
+    Also returns the mask of the cells with a corner that cannot be plotted in
+    the figure CRS (see `_project_grid`).
+    """
+    clons = _interp_edges(_interp_edges(lons, 0), 1)
+    clats = _interp_edges(_interp_edges(lats, 0), 1)
+    if _is_angular(datcrs):
+        # Corners extrapolated beyond the poles, or beyond the seam of a global
+        # grid, would wrap around and be taken for a dateline crossing
+        clons = np.clip(clons, lons.max() - 360, lons.min() + 360)
+        clats = np.clip(clats, -90, 90)
+
+    px, py, invalid = _project_grid(clons, clats, figcrs, datcrs)
+    if invalid is not None:
+        invalid = (
+            invalid[:-1, :-1] | invalid[1:, :-1] | invalid[:-1, 1:] | invalid[1:, 1:]
+        )
+
+    return px, py, invalid
+
+
+def _transform_grid_first(lons, lats, figcrs, datcrs):
+    """Grid and CRS to contour with, transformed into the figure CRS when possible
+
+    Same as cartopy's `transform_first`, except that the grid is left in the data
+    CRS if some of its points cannot be plotted in the figure CRS (see
+    `_project_grid`): contouring in the figure CRS would then draw streaks
+    across the map.
+    """
+    px, py, invalid = _project_grid(lons, lats, figcrs, datcrs)
+    if invalid is not None:
+        return lons, lats, datcrs
+
+    return px, py, figcrs
+
+
+def _clip_to_extent(lons, lats, data, extent, datcrs):
+    """Slice the grid to the smallest box covering the extent (with one cell margin)
+
+    If the data CRS is in longitudes and latitudes, the longitudes are compared
+    modulo 360 degrees, so the grid and the extent can use different conventions
+    (e.g. 0..360 and -180..180) and the extent can cross the antimeridian.
+    """
+    x0, x1, y0, y1 = extent
+    if _is_angular(datcrs):
+        inside = (lons - x0) % 360 <= x1 - x0
+    else:
+        inside = (lons >= x0) & (lons <= x1)
+    inside &= (lats >= y0) & (lats <= y1)
+    rows = np.flatnonzero(inside.any(axis=1))
+    cols = np.flatnonzero(inside.any(axis=0))
+    if rows.size == 0:
+        return lons, lats, data
+
+    box = (
+        slice(max(rows[0] - 1, 0), rows[-1] + 2),
+        slice(max(cols[0] - 1, 0), cols[-1] + 2),
+    )
+    return lons[box], lats[box], data[box]
+
+
 # Single plots
 # ------------
 
@@ -58,8 +304,13 @@ def isolines(
     lats=None,
     fig=None,
     ax=None,
-    figcrs=ccrs.PlateCarree(),
-    datcrs=ccrs.PlateCarree(),
+    figcrs=None,
+    datcrs=None,
+    transform_first=True,
+    pretransform=False,
+    clip_to_extent=False,
+    add_labels=True,
+    labels_kwargs=None,
 ):
     """Isoline plot (e.g. for mean sea level pressure)
 
@@ -81,11 +332,36 @@ def isolines(
     ax: `matplotlib.pyplot.Axes`
         The axes object in which the plot is made
 
-    figcrs:
-        Figure coordinate system. Set what the figure will look like
+    figcrs: `cartopy.crs.CRS`
+        Figure coordinate system. Set what the figure will look like. If None, `PlateCarree` is used
+
+    datcrs: `cartopy.crs.CRS`
+        Data coordinate system. Describes how the data is stored. If None, `PlateCarree` is used
+
+    transform_first: bool
+        If True, the grid points are transformed into the figure CRS before
+        contouring (much faster). If some grid points fall outside of the domain
+        of the figure CRS or the grid crosses its dateline, the contours are
+        computed in the data CRS instead
+
+    pretransform: bool
+        If True, the grid points are transformed into the figure CRS once, before
+        any call to matplotlib, and the plot is made directly in the figure CRS.
+        This is the fastest option. Points outside of the domain of the figure CRS
+        (e.g. the far side of the globe) and grid cells crossing its dateline are
+        masked, so the plot has a gap there instead of failing or wrapping around
+
+    clip_to_extent: bool
+        If True, the data are reduced to the part of the grid covering the extent
+        of `ax` before plotting, so no work is spent outside of the visible domain.
+        The extent must be set (e.g. with `ax.set_extent`) before calling this function
 
-    datcrs:
-        Data coordinate system. Describes how the data is stored
+    add_labels: bool
+        If True, the value of the isolines is written inline. Labelling is the most
+        expensive step of the plot, set it to False to skip it on dense isolines
+
+    labels_kwargs: dict
+        Arguments to pass on to `matplotlib.pyplot.clabel`, overriding the defaults
 
 
     Returns
@@ -111,11 +387,29 @@ def isolines(
     >>> fig, ax = plots.isolines(data, lon, lat, fig=fig, ax=ax)
     >>> fig.show()
     """
+    figcrs, datcrs = _replace_default_crs(figcrs, datcrs)
     fig, ax = _replace_default_figax(fig, ax, figcrs)
     lons, lats = _replace_default_latlon(lons, lats, data)
+    if clip_to_extent:
+        extent = ax.get_extent(crs=datcrs)
+        lons, lats, data = _clip_to_extent(lons, lats, data, extent, datcrs)
+    if pretransform:
+        lons, lats, invalid = _project_grid(lons, lats, ax.projection, datcrs)
+        data = _mask_invalid(data, invalid)
+        datcrs = ax.projection
+
+    if transform_first:
+        lons, lats, datcrs = _transform_grid_first(lons, lats, ax.projection, datcrs)
 
     axcl = ax.contour(lons, lats, data, colors="black", transform=datcrs)
-    ax.clabel(axcl, inline=True, fontsize=10, fmt="%4.f")
+    if add_labels:
+        labels_kwargs = {
+            "inline": True,
+            "fontsize": 10,
+            "fmt": "%4.f",
+            **(labels_kwargs or {}),
+        }
+        ax.clabel(axcl, **labels_kwargs)
 
     return fig, ax
 
@@ -128,8 +422,14 @@ def colorlevels(
     ax=None,
     varfamily="temperature",
     clabel="",
-    figcrs=ccrs.PlateCarree(),
-    datcrs=ccrs.PlateCarree(),
+    figcrs=None,
+    datcrs=None,
+    transform_first=True,
+    pretransform=False,
+    clip_to_extent=False,
+    method="contourf",
+    rasterized=True,
+    add_colorbar=True,
 ):
     """Color levels plot (e.g. for wind speed).
 
@@ -147,6 +447,18 @@ def colorlevels(
     clabel: str
         Label for the colorbar
 
+    method: {"contourf", "pcolormesh"}
+        Matplotlib function used to draw the color levels. "contourf" draws true
+        isobands. "pcolormesh" colors each grid cell with the same discrete colors,
+        skipping the contouring step entirely (much faster on dense grids)
+
+    rasterized: bool
+        If True, the color levels are rendered as an image in vector outputs (PDF,
+        SVG), while coastlines and gridlines stay vectors
+
+    add_colorbar: bool
+        If False, no colorbar is drawn (e.g. when several plots share the same one)
+
 
     Returns
     -------
@@ -166,36 +478,57 @@ def colorlevels(
     >>> fig, ax = plots.colorlevels(data, lon, lat, varfamily="temperature")
     >>> fig.show()
     """
+    figcrs, datcrs = _replace_default_crs(figcrs, datcrs)
     fig, ax = _replace_default_figax(fig, ax, figcrs)
     lons, lats = _replace_default_latlon(lons, lats, data)
-
-    colormap, norm = metcm.get_colorlevels_from_varfamily(varfamily)
-    values = norm.boundaries[1:-1]
-
-    axcf = ax.contourf(
-        lons,
-        lats,
-        data,
-        values,
-        cmap=colormap,
-        norm=norm,
-        extend="both",
-        transform=datcrs,
-        vmin=values[0],
-        vmax=values[-1],
-    )
-    cbar = plt.colorbar(
-        axcf,
-        ticks=values,
-        extend="both",
-        orientation="vertical",
-        shrink=0.3,
-    )
-
-    for t in cbar.ax.get_yticklabels():
-        t.set_fontsize(10)
-
-    cbar.set_label(clabel, fontsize=10)
+    if clip_to_extent:
+        extent = ax.get_extent(crs=datcrs)
+        lons, lats, data = _clip_to_extent(lons, lats, data, extent, datcrs)
+    if pretransform and method == "pcolormesh":
+        lons, lats, invalid = _project_cells(lons, lats, ax.projection, datcrs)
+        data = _mask_invalid(data, invalid)
+        datcrs = ax.projection
+    elif pretransform:
+        lons, lats, invalid = _project_grid(lons, lats, ax.projection, datcrs)
+        data = _mask_invalid(data, invalid)
+        datcrs = ax.projection
+
+    colormap, norm, values = _get_colorlevels(varfamily)
+
+    if method == "contourf" and transform_first:
+        lons, lats, datcrs = _transform_grid_first(lons, lats, ax.projection, datcrs)
+
+    if method == "contourf":
+        axcf = ax.contourf(
+            lons,
+            lats,
+            data,
+            values,
+            cmap=colormap,
+            norm=norm,
+            extend="both",
+            transform=datcrs,
+            vmin=values[0],
+            vmax=values[-1],
+            rasterized=rasterized,
+        )
+    elif method == "pcolormesh":
+        axcf = ax.pcolormesh(
+            lons,
+            lats,
+            data,
+            cmap=colormap,
+            norm=norm,
+            transform=datcrs,
+            shading="auto",
+            rasterized=rasterized,
+        )
+    else:
+        raise ValueError(
+            f"Unknown method={method}. Possible values are 'contourf' or 'pcolormesh'"
+        )
+    if add_colorbar:
+        _add_colorbar(axcf, clabel, ticks=values)
 
     return fig, ax
 
@@ -208,8 +541,14 @@ def colorshades(
     ax=None,
     varfamily="temperature",
     clabel="",
-    figcrs=ccrs.PlateCarree(),
-    datcrs=ccrs.PlateCarree(),
+    figcrs=None,
+    datcrs=None,
+    pretransform=False,
+    clip_to_extent=False,
+    rasterized=True,
+    vmin=None,
+    vmax=None,
+    add_colorbar=True,
 ):
     """Color levels plot (e.g. for wind speed).
 
@@ -219,26 +558,39 @@ def colorshades(
 
     Parameters
     ----------
-    Same as in `colorlevels`
+    All other parameters are the same as in `colorlevels`
+
+    rasterized: bool
+        If True, the mesh is rendered as an image in vector outputs (PDF, SVG),
+        which keeps files small and fast to draw for dense grids
+
+    vmin, vmax: float
+        Range of the colormap. If None, it is taken from the data (symmetric around
+        zero for varfamily="diff")
 
 
     Returns
     -------
     Same as in `colorlevels`
     """
+    figcrs, datcrs = _replace_default_crs(figcrs, datcrs)
     fig, ax = _replace_default_figax(fig, ax, figcrs)
     lons, lats = _replace_default_latlon(lons, lats, data)
+    if clip_to_extent:
+        extent = ax.get_extent(crs=datcrs)
+        lons, lats, data = _clip_to_extent(lons, lats, data, extent, datcrs)
+    if pretransform:
+        lons, lats, invalid = _project_cells(lons, lats, ax.projection, datcrs)
+        data = _mask_invalid(data, invalid)
+        datcrs = ax.projection
 
     colormap = metcm.get_colormap_from_varfamily(varfamily)
-    
-    if varfamily == "diff":
+
+    if varfamily == "diff" and vmin is None and vmax is None:
         absmax = np.abs(data).max()
         vmin = -absmax
         vmax = absmax
-    else:
-        vmin = None
-        vmax = None
-    
+
     axpc = ax.pcolormesh(
         lons,
         lats,
@@ -247,18 +599,11 @@ def colorshades(
         transform=datcrs,
         vmin=vmin,
         vmax=vmax,
+        shading="auto",
+        rasterized=rasterized,
     )
-    cbar = plt.colorbar(
-        axpc,
-        extend="both",
-        orientation="vertical",
-        shrink=0.3,
-    )
-
-    for t in cbar.ax.get_yticklabels():
-        t.set_fontsize(10)
-
-    cbar.set_label(clabel, fontsize=10)
+    if add_colorbar:
+        _add_colorbar(axpc, clabel)
 
     return fig, ax
 
@@ -269,9 +614,12 @@ def plumes(
     fig=None,
     ax=None,
     color="cornflowerblue",
+    linestyle="--",
+    alpha=0.2,
     title=None,
     xlabel=None,
     ylabel=None,
+    **kwargs,
 ):
     """Plumes showing the dispersion of an ensemble forecast
 
@@ -293,6 +641,12 @@ def plumes(
     color: str or RGBA tuple
         Color of the plumes
 
+    linestyle: str
+        Line style of the plumes
+
+    alpha: float
+        Transparency of the plumes
+
     title: str
         Title of the plot
 
@@ -302,6 +656,9 @@ def plumes(
     ylabel: str
         Label for the y-axis
 
+    **kwargs:
+        Any additional argument to pass on to `matplotlib.collections.LineCollection`
+
 
     Returns
     -------
@@ -316,10 +673,17 @@ def plumes(
     n_mbr, n_ldt = data.shape
 
     if x is None:
-        x = np.arange(n_ldt)
-
-    for i in range(n_mbr):
-        ax.plot(x, data[i, :], linestyle="--", color=color, alpha=0.2)
+        x = np.arange(n_ldt, dtype=np.float64)
+
+    # Collections are not unit-aware: convert x (e.g. datetimes) to axis values
+    ax.xaxis.update_units(x)
+    segs = np.empty((n_mbr, n_ldt, 2))
+    segs[..., 0] = ax.convert_xunits(x)
+    segs[..., 1] = data
+    ax.add_collection(
+        LineCollection(segs, colors=color, linestyles=linestyle, alpha=alpha, **kwargs)
+    )
+    ax.autoscale_view()
 
     ax.grid()
     if title is not None:
@@ -366,41 +730,55 @@ def quantiles(
 
     n_mbr, n_ldt = data.shape
     if x is None:
-        x = np.arange(n_ldt)
-
-    qvalues = np.quantile(data, quantiles, axis=0)
-
-    for i in range(len(quantiles) // 2):
-        ax.plot(
-            x,
-            qvalues[i, :],
-            color=cmap(quantiles[i]),
-            linestyle="--",
-            label=f"Quantile {quantiles[i]}",
-        )
-        ax.plot(
-            x,
-            qvalues[-i - 1, :],
-            color=cmap(quantiles[-i - 1]),
-            linestyle="--",
-            label=f"Quantile {quantiles[-i-1]}",
+        x = np.arange(n_ldt, dtype=np.float64)
+
+    qarr = np.asarray(quantiles)
+    qvalues = np.quantile(data, qarr, axis=0)
+    qcolors = cmap(qarr)
+
+    n_q = len(quantiles)
+    n_bands = n_q // 2
+
+    # Band limits are ordered by pairs (lower, upper), then the median if any
+    line_idx = []
+    for i in range(n_bands):
+        line_idx += [i, n_q - i - 1]
+    if n_q % 2 == 1:
+        line_idx.append(n_bands)
+
+    line_colors = qcolors[line_idx]
+    line_styles = ["--"] * 2 * n_bands + ["-"] * (n_q % 2)
+    line_labels = [f"Quantile {quantiles[k]}" for k in line_idx]
+
+    # Collections are not unit-aware: convert x (e.g. datetimes) to axis values
+    ax.xaxis.update_units(x)
+    x = np.asarray(ax.convert_xunits(x))
+    bands = [
+        np.concatenate(
+            [
+                np.column_stack([x, qvalues[i, :]]),
+                np.column_stack([x[::-1], qvalues[n_q - i - 1, ::-1]]),
+            ]
         )
-        ax.fill_between(
-            x, qvalues[i, :], qvalues[-i - 1, :], color=cmap(quantiles[i]), alpha=0.2
-        )
-
-    if len(quantiles) % 2 == 1:
-        i = len(quantiles) // 2
-        ax.plot(
-            x,
-            qvalues[i, :],
-            color=cmap(quantiles[i]),
-            linestyle="-",
-            label=f"Quantile {quantiles[i]}",
+        for i in range(n_bands)
+    ]
+    ax.add_collection(PolyCollection(bands, color=qcolors[:n_bands], alpha=0.2))
+    ax.add_collection(
+        LineCollection(
+            [np.column_stack([x, qvalues[k, :]]) for k in line_idx],
+            colors=line_colors,
+            linestyles=line_styles,
         )
+    )
+    ax.autoscale_view()
 
     ax.grid()
-    ax.legend()
+    ax.legend(
+        handles=[
+            Line2D([], [], color=c, linestyle=ls, label=lab)
+            for c, ls, lab in zip(line_colors, line_styles, line_labels)
+        ]
+    )
     if title is not None:
         ax.set_title(title)
     if xlabel is not None:
@@ -418,8 +796,11 @@ def scatter(
     clabel="",
     markersize = 3,
     title=None,
-    figcrs=ccrs.PlateCarree(),
-    datcrs=ccrs.PlateCarree(),
+    figcrs=None,
+    datcrs=None,
+    resolution="auto",
+    fig=None,
+    ax=None,
     **kwargs,
 ):
     """Scatter plot on a map.
@@ -445,11 +826,22 @@ def scatter(
     markersize: int
         Size of the markers in the scatter plot (same for all)
 
-    figcrs:
-        Figure coordinate system. Set what the figure will look like
+    figcrs: `cartopy.crs.CRS`
+        Figure coordinate system. Set what the figure will look like. If None, `PlateCarree` is used
+
+    datcrs: `cartopy.crs.CRS`
+        Data coordinate system. Describes how the data is stored. If None, `PlateCarree` is used
+
+    resolution: str
+        Resolution of the coastlines ("10m", "50m" or "110m"). If "auto", it is
+        chosen from the extent of the map when it is drawn
+
+    fig: `matplotlib.pyplot.Figure`
+        The figure object in which the plot is made. If None, a new one is created
 
-    datcrs:
-        Data coordinate system. Describes how the data is stored
+    ax: `matplotlib.pyplot.Axes`
+        The axes object in which the plot is made. If None, a new one is created,
+        with coastlines
     
     **kwargs:
         Any additional argument to pass on to `matplotlib.pyplot.scatter`
@@ -470,9 +862,11 @@ def scatter(
     >>> fig, ax = plots.scatter(data, lon, lat, varfamily="temperature")
     >>> fig.show()
     """
-    fig = plt.figure(figsize=default_figsize)
-    ax = plt.subplot(projection=figcrs)
-    ax.coastlines(resolution="50m", color="black", linewidth=0.5)
+    figcrs, datcrs = _replace_default_crs(figcrs, datcrs)
+    new_axes = ax is None
+    fig, ax = _replace_default_figax(fig, ax, figcrs)
+    if new_axes:
+        _add_coastlines(ax, resolution)
 
     colormap = metcm.get_colormap_from_varfamily(varfamily)
     
@@ -495,17 +889,7 @@ def scatter(
         vmax=vmax,
         **kwargs,
     )
-    cbar = plt.colorbar(
-        axpc,
-        extend="both",
-        orientation="vertical",
-        shrink=0.3,
-    )
-
-    for t in cbar.ax.get_yticklabels():
-        t.set_fontsize(10)
-
-    cbar.set_label(clabel, fontsize=10)
+    _add_colorbar(axpc, clabel)
 
     grd = ax.gridlines(draw_labels=True, linestyle="--")
     grd.top_labels = False
@@ -529,8 +913,12 @@ def twovar_plot(
     cl_varfamily="temp",
     title=None,
     clabel=None,
-    figcrs=ccrs.PlateCarree(),
-    datcrs=ccrs.PlateCarree(),
+    figcrs=None,
+    datcrs=None,
+    resolution="auto",
+    fig=None,
+    ax=None,
+    transform_first=True,
 ):
     """Plot two variable on the same graph
 
@@ -558,11 +946,25 @@ def twovar_plot(
     clabel: str
         Colorbar label
 
-    figcrs:
-        Figure coordinate system. Set what the figure will look like
+    figcrs: `cartopy.crs.CRS`
+        Figure coordinate system. Set what the figure will look like. If None, `PlateCarree` is used
+
+    datcrs: `cartopy.crs.CRS`
+        Data coordinate system. Describes how the data is stored. If None, `PlateCarree` is used
+
+    resolution: str
+        Resolution of the coastlines ("10m", "50m" or "110m"). If "auto", it is
+        chosen from the extent of the map when it is drawn
+
+    fig: `matplotlib.pyplot.Figure`
+        The figure object in which the plot is made. If None, a new one is created
+
+    ax: `matplotlib.pyplot.Axes`
+        The axes object in which the plot is made. If None, a new one is created,
+        with coastlines
 
-    datcrs:
-        Data coordinate system. Describes how the data is stored
+    transform_first: bool
+        Same as in `isolines`
 
 
 
@@ -585,11 +987,21 @@ def twovar_plot(
     >>> fig, ax = plots.twovar_plot(z500, t500, lons=lon, lats=lat)
     >>> fig.show()
     """
-    fig = plt.figure(figsize=default_figsize)
-    ax = plt.subplot(projection=figcrs)
-    ax.coastlines(resolution="50m", color="black", linewidth=0.5)
+    figcrs, datcrs = _replace_default_crs(figcrs, datcrs)
+    new_axes = ax is None
+    fig, ax = _replace_default_figax(fig, ax, figcrs)
+    if new_axes:
+        _add_coastlines(ax, resolution)
 
-    fig, ax = isolines(il_data, lons=lons, lats=lats, fig=fig, ax=ax, datcrs=datcrs)
+    fig, ax = isolines(
+        il_data,
+        lons=lons,
+        lats=lats,
+        fig=fig,
+        ax=ax,
+        datcrs=datcrs,
+        transform_first=transform_first,
+    )
     fig, ax = colorlevels(
         cl_data,
         varfamily=cl_varfamily,
@@ -599,6 +1011,7 @@ def twovar_plot(
         fig=fig,
         ax=ax,
         datcrs=datcrs,
+        transform_first=transform_first,
     )
 
     grd = ax.gridlines(draw_labels=True, linestyle="--")
@@ -621,8 +1034,11 @@ def twovar_comparison(
     cl_varfamily="temp",
     titles=str4x4,
     clabels=str4x4,
-    figcrs=ccrs.PlateCarree(),
-    datcrs=ccrs.PlateCarree(),
+    figcrs=None,
+    datcrs=None,
+    resolution="auto",
+    constrained_layout=True,
+    pretransform=True,
 ):
     """Four (2x2) subplots to compare a two-variable plot in two situations.
 
@@ -660,14 +1076,29 @@ def twovar_comparison(
         Titles for each subplot
 
     clabels: ndarray of shape (2,2)
-        Colorbar label for each subplot
+        Colorbar label for each subplot. The two upper subplots share the same color
+        levels, hence the same colorbar, labelled with `clabels[0, 0]` (`clabels[0, 1]`
+        is not used)
+
+    figcrs: `cartopy.crs.CRS`
+        Figure coordinate system. Set what the figure will look like. If None, `PlateCarree` is used
+
+    datcrs: `cartopy.crs.CRS`
+        Data coordinate system. Describes how the data is stored. If None, `PlateCarree` is used
 
-    figcrs:
-        Figure coordinate system. Set what the figure will look like
+    resolution: str
+        Resolution of the coastlines ("10m", "50m" or "110m"). If "auto", it is
+        chosen from the extent of the map when it is drawn
 
-    datcrs:
-        Data coordinate system. Describes how the data is stored
+    constrained_layout: bool
+        If True, the figure uses matplotlib's constrained layout, which also makes
+        room for the colorbar shared by the two upper subplots
 
+    pretransform: bool
+        If True, the grid is transformed into the figure CRS once for the four
+        subplots, which are then drawn directly in the figure CRS. The grid is left
+        in the data CRS if some of its points fall outside of the domain of the
+        figure CRS or if it crosses its dateline
 
 
     Returns
@@ -691,83 +1122,111 @@ def twovar_comparison(
     >>> fig, ax = plots.twovar_comparison(iso0, iso1, cl0, cl1, lons=lon, lats=lat)
     >>> fig.show()
     """
+    figcrs, datcrs = _replace_default_crs(figcrs, datcrs)
     fig, axs = plt.subplots(
-        nrows=2, ncols=2, figsize=default_figsize, subplot_kw={"projection": figcrs}
-    )
-    land_50m = cfeature.NaturalEarthFeature(
-        "physical", "land", "50m", edgecolor="face", facecolor=cfeature.COLORS["land"]
+        nrows=2,
+        ncols=2,
+        figsize=default_figsize,
+        subplot_kw={"projection": figcrs},
+        layout="constrained" if constrained_layout else None,
     )
+    land = _get_land_feature(resolution)
 
     for ax, title in zip(axs.flatten(), titles.flatten()):
-        ax.add_feature(land_50m, alpha=0.5)
-        ax.coastlines(resolution="50m", color="black", linewidth=0.5)
+        ax.add_feature(land, alpha=0.5)
+        _add_coastlines(ax, resolution)
         ax.set_title(title)
         grd = ax.gridlines(draw_labels=True, linestyle="--")
         grd.top_labels = False
         grd.right_labels = False
 
+    lons, lats = _replace_default_latlon(lons, lats, il_data0)
+
+    # No scratch buffer here: pcolormesh copies the array it is given, so writing
+    # the difference into a reused buffer would not save any allocation
+    il_diff = il_data0 - il_data1
+    cl_diff = cl_data0 - cl_data1
+
+    # The grid is the same in the four panels: it is projected once in the figure
+    # CRS, with the cell corners of the differences computed in the data CRS
+    plotcrs = datcrs
+    diff_lons, diff_lats = lons, lats
+    if pretransform:
+        px, py, invalid = _project_grid(lons, lats, figcrs, datcrs)
+        if invalid is None:
+            diff_lons, diff_lats, invalid = _project_cells(lons, lats, figcrs, datcrs)
+            il_diff = _mask_invalid(il_diff, invalid)
+            cl_diff = _mask_invalid(cl_diff, invalid)
+            lons, lats, plotcrs = px, py, figcrs
+
     ### axs[0, 0]
 
     fig, axs[0, 0] = isolines(
-        il_data0, lons=lons, lats=lats, fig=fig, ax=axs[0, 0], datcrs=datcrs
+        il_data0, lons=lons, lats=lats, fig=fig, ax=axs[0, 0], datcrs=plotcrs
     )
     fig, axs[0, 0] = colorlevels(
         cl_data0,
         lons=lons,
         lats=lats,
         varfamily=cl_varfamily,
-        clabel=clabels[0, 0],
         fig=fig,
         ax=axs[0, 0],
-        datcrs=datcrs,
+        datcrs=plotcrs,
+        add_colorbar=False,
     )
 
     ### axs[0, 1]
 
     fig, axs[0, 1] = isolines(
-        il_data1, lons=lons, lats=lats, fig=fig, ax=axs[0, 1], datcrs=datcrs
+        il_data1, lons=lons, lats=lats, fig=fig, ax=axs[0, 1], datcrs=plotcrs
     )
     fig, axs[0, 1] = colorlevels(
         cl_data1,
         lons=lons,
         lats=lats,
         varfamily=cl_varfamily,
-        clabel=clabels[0, 1],
         fig=fig,
         ax=axs[0, 1],
-        datcrs=datcrs,
+        datcrs=plotcrs,
+        add_colorbar=False,
     )
 
     ### axs[1, 0]
-    
-    il_diff = il_data0 - il_data1
-    absmax = np.abs(il_diff).max()
-    
+
     fig, axs[1, 0] = colorshades(
         il_diff,
-        lons=lons,
-        lats=lats,
+        lons=diff_lons,
+        lats=diff_lats,
         varfamily="diff",
         clabel=clabels[1, 0],
         fig=fig,
         ax=axs[1, 0],
-        datcrs=datcrs,
+        datcrs=plotcrs,
     )
 
     ### axs[1, 1]
 
     fig, axs[1, 1] = colorshades(
-        cl_data0 - cl_data1,
-        lons=lons,
-        lats=lats,
+        cl_diff,
+        lons=diff_lons,
+        lats=diff_lats,
         varfamily="diff",
         clabel=clabels[1, 1],
         fig=fig,
         ax=axs[1, 1],
-        datcrs=datcrs,
+        datcrs=plotcrs,
     )
 
-    fig.tight_layout()
+    # The boundaries are given explicitly, otherwise the colorbar of a bare
+    # ScalarMappable spans the whole norm, including the extension bins
+    colormap, norm, values = _get_colorlevels(cl_varfamily)
+    _add_colorbar(
+        ScalarMappable(norm=norm, cmap=colormap),
+        clabels[0, 0],
+        ax=axs[0, :],
+        boundaries=values,
+        ticks=values,
+    )
 
     return fig, axs
 
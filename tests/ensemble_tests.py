@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Metplotlib
+
+Ensemble plotting tests
+"""
+import numpy as np
+
+from metplotlib import plots
+
+n_mbr, n_ldt = (51, 72)
+leadtimes = np.arange(n_ldt)
+rng = np.random.default_rng()
+periods = 24 + 1.5 * rng.random((n_mbr, 1))
+phases = 0.8 * rng.random((n_mbr, 1))
+offsets = 5 * rng.random((n_mbr, 1))
+temp = 15 * np.sin(np.pi * leadtimes / periods + phases) + offsets
+
+fig, ax = plots.plumes(
+    temp, x=leadtimes, xlabel="Leadtime (hours)", ylabel="2m temperature"
+)
+fig.show()
+
+fig, ax = plots.quantiles(
+    temp, x=leadtimes, xlabel="Leadtime (hours)", ylabel="2m temperature"
+)
+fig.show()
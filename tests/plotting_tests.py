@@ -4,6 +4,8 @@
 
 Plotting tests
 """
+import cartopy.crs as ccrs
+import matplotlib.pyplot as plt
 import numpy as np
 
 from metplotlib import plots
@@ -18,3 +20,41 @@ mslp = 1015 + 10*(np.sin(20*np.pi*lon/180) + np.cos(25*np.pi*lat/180))
 
 fig, ax = plots.twovar_plot(mslp, t2m, lons=lon, lats=lat, cl_varfamily = "temp")
 fig.show()
+
+# Global grid seen from an orthographic projection: half of the points are on the
+# far side of the globe and do not project to finite coordinates
+glon, glat = np.meshgrid(np.linspace(-180, 180, 145), np.linspace(-90, 90, 73))
+gt2m = 30 * np.cos(np.pi*glat/180) + np.sin(20*np.pi*glon/180)
+ortho = ccrs.Orthographic(0, 45)
+fig, ax = plots.colorlevels(gt2m, lons=glon, lats=glat, figcrs=ortho, pretransform=True)
+fig.show()
+fig, ax = plots.colorshades(gt2m, lons=glon, lats=glat, figcrs=ortho, pretransform=True)
+fig.show()
+gmslp = 1015 + 10*np.sin(20*np.pi*glon/180)
+fig, ax = plots.twovar_plot(gmslp, gt2m, lons=glon, lats=glat, figcrs=ortho)
+fig.show()
+fig, axs = plots.twovar_comparison(
+    gmslp, gmslp + 1, gt2m, gt2m + 1, lons=glon, lats=glat, figcrs=ortho
+)
+fig.show()
+fig, axs = plots.twovar_comparison(
+    gmslp,
+    gmslp + 1,
+    gt2m,
+    gt2m + 1,
+    lons=glon,
+    lats=glat,
+    figcrs=ccrs.PlateCarree(central_longitude=180),
+)
+fig.show()
+
+# Grid with longitudes in 0..360 clipped to an extent given in -180..180
+lon360, lat360 = np.meshgrid(np.linspace(0, 359, 360), np.linspace(-90, 90, 181))
+t2m360 = 30 * np.cos(np.pi*lat360/180) + np.sin(20*np.pi*lon360/180)
+fig = plt.figure()
+ax = plt.axes(projection=ccrs.PlateCarree())
+ax.set_extent([-30, 40, 30, 70])
+fig, ax = plots.colorlevels(
+    t2m360, lons=lon360, lats=lat360, fig=fig, ax=ax, clip_to_extent=True
+)
+fig.show()